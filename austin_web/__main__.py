@@ -25,25 +25,34 @@ import json
 import sys
 import weakref
 from enum import Enum
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
 
-from aiohttp import web
-from aiohttp.test_utils import unused_port
 from austin import AustinError
 from austin import AustinTerminated
 from austin.aio import AsyncAustin
 from austin.cli import AustinArgumentParser
 from austin.cli import AustinCommandLineError
-from halo import Halo
 
 from austin_web import _figlet
 from austin_web.data import DataPool
 from austin_web.data import WebFrame
 from austin_web.html import load_compile
 from austin_web.html import load_site
+from austin_web.html import missing_assets
+
+
+# The web server and the spinner are only needed in serve and compile mode
+# respectively, so they are imported lazily to keep the startup time down.
+if TYPE_CHECKING:
+    from aiohttp import web
+    from halo import Halo
+
+    from austin_web.static import StaticAsset
 
 
 if sys.platform == "win32":
@@ -93,6 +102,13 @@ class AustinWebArgumentParser(AustinArgumentParser):
             "into the given output file.",
             type=str,
         )
+        self.add_argument(
+            "-O",
+            "--offline",
+            help="Embed the UI assets into the compiled HTML page so that it can "
+            "be viewed without a network connection.",
+            action="store_true",
+        )
 
 
 class AustinWebMode(Enum):
@@ -111,21 +127,35 @@ class AustinWeb(AsyncAustin):
         self._args = AustinWebArgumentParser().parse_args(args)
         if self._args.compile and self._args.serve:
             raise AustinCommandLineError("Incompatible options: compile and serve.", -1)
+        if self._args.offline and not self._args.compile:
+            raise AustinCommandLineError("The offline option requires compile.", -1)
+        if self._args.offline:
+            # Fail early rather than after collecting all the samples.
+            missing = missing_assets()
+            if missing:
+                raise AustinWebError(
+                    "Cannot compile offline, missing vendored UI assets: "
+                    + ", ".join(missing)
+                )
 
         self._mode = (
             AustinWebMode.COMPILE if self._args.compile else AustinWebMode.SERVE
         )
         self._pools: weakref.WeakSet = weakref.WeakSet()
         self._pool: Optional[DataPool] = None
-        self._runner: Optional[web.AppRunner] = None
+        self._runner: Optional["web.AppRunner"] = None
         self._global_stats: Optional[str] = None
-        self._spinner: Optional[Halo] = None
+        self._spinner: Optional["Halo"] = None
+        self._assets: Dict[str, "StaticAsset"] = {}
+        self._home: Optional["StaticAsset"] = None
 
     def on_ready(self, *args: Any, **kwargs: Any) -> None:
         """Austin ready callback."""
         if self._mode is AustinWebMode.SERVE:
             asyncio.create_task(self.start_server())
         else:
+            from halo import Halo
+
             self._spinner = Halo(text="Sampling", spinner="dots")
             self._spinner.start()
             self._pool = DataPool(self)
@@ -184,16 +214,45 @@ class AustinWeb(AsyncAustin):
                 load_compile(
                     data=json.dumps(self._pool.data.to_dict()),
                     profile_type="Memory" if self._args.memory else "Time",
+                    offline=self._args.offline,
                 )
             )
             print(f"✨🧁✨ Samples compiled into {self._args.compile}")
 
-    async def handle_home(self, request: web.Request) -> web.Response:
+    async def handle_home(self, request: "web.Request") -> "web.Response":
         """Home page handler."""
-        return web.Response(body=self.html, content_type="text/html")
+        from austin_web.static import REVALIDATE
+
+        if self._home is None:
+            raise AustinWebError("Home page is unexpectedly missing")
+
+        return self._home.response(request, REVALIDATE)
 
-    async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+    async def handle_static(self, request: "web.Request") -> "web.Response":
+        """Static assets handler.
+
+        Requests for the versioned URL of an asset are allowed to be cached
+        indefinitely, since a new version of the asset has a new URL.
+        """
+        from aiohttp import web
+
+        from austin_web.static import IMMUTABLE
+        from austin_web.static import REVALIDATE
+
+        try:
+            asset = self._assets[request.match_info["name"]]
+        except KeyError:
+            raise web.HTTPNotFound() from None
+
+        return asset.response(
+            request,
+            IMMUTABLE if request.query.get("v") == asset.version else REVALIDATE,
+        )
+
+    async def handle_websocket(self, request: "web.Request") -> "web.WebSocketResponse":
         """Web socket handler."""
+        from aiohttp import web
+
         ws = web.WebSocketResponse()
         await ws.prepare(request)
 
@@ -222,15 +281,27 @@ class AustinWeb(AsyncAustin):
 
     async def start_server(self) -> None:
         """Start the web server asynchronously."""
+        from aiohttp import web
+        from aiohttp.test_utils import unused_port
+
+        from austin_web.static import StaticAsset
+        from austin_web.static import load_static_assets
+
         app = web.Application()
         app.add_routes(
-            [web.get("/", self.handle_home), web.get("/ws", self.handle_websocket)]
+            [
+                web.get("/", self.handle_home),
+                web.get("/ws", self.handle_websocket),
+                web.get("/static/{name:.+}", self.handle_static),
+            ]
         )
 
         port = self._args.port or unused_port()
         host = self._args.host
 
-        self.html = load_site()
+        self._assets = load_static_assets()
+        self.html = load_site({name: _.url for name, _ in self._assets.items()})
+        self._home = StaticAsset("index.html", self.html.encode(), "text/html")
 
         self._runner = web.AppRunner(app)
         if not self._runner:
@@ -307,7 +378,7 @@ def main() -> None:
     """The main function."""
     try:
         _main(AustinWeb, sys.argv[1:])
-    except AustinCommandLineError as e:
+    except (AustinCommandLineError, AustinWebError) as e:
         message, *code = e.args
         print(message)
         exit(code[0] if code else -1)
@@ -1,4 +1,5 @@
 import json
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
 from typing import List
@@ -6,13 +7,16 @@ from typing import Optional
 from typing import cast
 
 import psutil
-from aiohttp import web
 from austin.aio import AsyncAustin
 from austin.stats import Frame
 from austin.stats import MetricType
 from austin.stats import Sample
 
 
+if TYPE_CHECKING:
+    from aiohttp import web
+
+
 class WebFrame:
     """Frame class designed to work nicely with d3-flame-graph."""
 
@@ -133,7 +137,7 @@ class DataPool:
         self.data += frame
         self.samples += 1
 
-    async def send(self, ws: web.WebSocketResponse) -> bool:
+    async def send(self, ws: "web.WebSocketResponse") -> bool:
         """Send profiling data to websocket asynchronously.
 
         Returns ``True`` on success, ``False`` otherwise.
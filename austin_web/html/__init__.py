@@ -1,13 +1,137 @@
 """HTML resource handling utilities."""
 
+import hashlib
+import posixpath
+import re
+from base64 import b64encode
 from importlib.resources import files
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
 
 
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
+
+SITE = "index.html"
+COMPILE = "austin_web.html"
+
+VENDOR = "vendor"
+
+
+class VendorAsset(NamedTuple):
+    """Third-party asset, pinned to an upstream URL.
+
+    The ``integrity`` is the Subresource Integrity hash of the asset, which is
+    used both to check the vendored copy and when linking to the upstream URL.
+    """
+
+    url: str
+    integrity: Optional[str] = None
+
+
+# The third-party assets used by the UI. Vendored copies are looked up in the
+# VENDOR folder, and the upstream URL is used for any asset that is not
+# vendored. Run ``python hatch_build.py`` to refresh the vendored copies and
+# get the integrity hashes to pin here.
+VENDOR_ASSETS = {
+    "d3/d3.v4.min.js": VendorAsset("https://d3js.org/d3.v4.min.js"),
+    "d3-tip/d3-tip.min.js": VendorAsset(
+        "https://cdnjs.cloudflare.com/ajax/libs/d3-tip/0.9.1/d3-tip.min.js"
+    ),
+    "d3-flame-graph/d3-flamegraph.min.js": VendorAsset(
+        "https://cdn.jsdelivr.net/gh/spiermar/d3-flame-graph@2.0.3/dist/d3-flamegraph.min.js"
+    ),
+    "d3-flame-graph/d3-flamegraph.css": VendorAsset(
+        "https://cdn.jsdelivr.net/gh/spiermar/d3-flame-graph@2.0.3/dist/d3-flamegraph.css"
+    ),
+    "tailwindcss/tailwind.min.css": VendorAsset(
+        "https://unpkg.com/tailwindcss@1.9.6/dist/tailwind.min.css"
+    ),
+    "fontawesome/css/all.min.css": VendorAsset(
+        "https://use.fontawesome.com/releases/v5.8.1/css/all.min.css"
+    ),
+    "fontawesome/webfonts/fa-solid-900.woff2": VendorAsset(
+        "https://use.fontawesome.com/releases/v5.8.1/webfonts/fa-solid-900.woff2"
+    ),
+    "fontawesome/webfonts/fa-solid-900.woff": VendorAsset(
+        "https://use.fontawesome.com/releases/v5.8.1/webfonts/fa-solid-900.woff"
+    ),
+}
+
+# A link to an asset, with the optional integrity hash of the linked content.
+Link = Tuple[str, Optional[str]]
+
+CSS_URL_RE = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+
+# The content types of the UI resources. Looking them up here spares loading
+# the system MIME types database on startup.
+CONTENT_TYPES = {
+    ".css": "text/css",
+    ".html": "text/html",
+    ".js": "text/javascript",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+}
+
+
+def _resource_path(name: str) -> "Traversable":
+    path = files("austin_web.html")
+    for part in name.split("/"):
+        path = path.joinpath(part)
+    return path
+
+
 def get_resource(name: str) -> str:
     """Load a resource file from the submodule ``austin_web.html``."""
-    return files("austin_web.html").joinpath(name).read_text(encoding="utf-8")
+    return _resource_path(name).read_text(encoding="utf-8")
+
+
+def get_resource_bytes(name: str) -> bytes:
+    """Load a binary resource file from the submodule ``austin_web.html``."""
+    return _resource_path(name).read_bytes()
+
+
+def get_content_type(name: str) -> str:
+    """Guess the content type of a resource from its name."""
+    try:
+        return CONTENT_TYPES[posixpath.splitext(name)[1].lower()]
+    except KeyError:
+        import mimetypes
+
+        return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+def integrity(content: bytes) -> str:
+    """Compute the Subresource Integrity hash of the given content."""
+    return "sha384-" + b64encode(hashlib.sha384(content).digest()).decode()
+
+
+def vendored_assets() -> Dict[str, bytes]:
+    """Load the third-party assets that are vendored."""
+    assets = {}
+    for name in VENDOR_ASSETS:
+        try:
+            assets[name] = get_resource_bytes(f"{VENDOR}/{name}")
+        except FileNotFoundError:
+            continue
+    return assets
+
+
+def missing_assets() -> List[str]:
+    """List the third-party assets that are not vendored."""
+    return [
+        name
+        for name in VENDOR_ASSETS
+        if not _resource_path(f"{VENDOR}/{name}").is_file()
+    ]
 
 
 def _find_marker(
@@ -41,8 +165,12 @@ def replace_references(text: str) -> str:
     return text
 
 
-def replace_links(text: str) -> str:
-    """Replace [[ link ]] with a link to the referenced resource."""
+def replace_links(text: str, link: Callable[[str], Link]) -> str:
+    """Replace [[ attribute: asset ]] with the link to the referenced asset.
+
+    The ``link`` callable maps the asset name to the actual link. If the link
+    comes with an integrity hash, the corresponding attributes are added too.
+    """
     begin = 0
     while True:
         marker = _find_marker(text, "[[", "]]", begin)
@@ -51,12 +179,16 @@ def replace_links(text: str) -> str:
 
         begin, end, placeholder = marker
 
-        reference = placeholder[2:-2].strip()
-        link = "file://" + get_resource(reference)
+        attribute, _, reference = placeholder[2:-2].partition(":")
+        url, sri = link(reference.strip())
 
-        text = text.replace(placeholder, link)
+        resolved = f'{attribute.strip()}="{url}"'
+        if sri is not None:
+            resolved += f' integrity="{sri}" crossorigin="anonymous"'
 
-        begin += len(link)
+        text = text.replace(placeholder, resolved)
+
+        begin += len(resolved)
 
     return text
 
@@ -88,25 +220,108 @@ def replace_placeholders(text: str, **kwargs: str) -> str:
     return text
 
 
-def _load_and_resolve_resource(name: str, **kwargs: str) -> str:
-    return replace_placeholders(
-        replace_links(replace_references(get_resource(name))), **kwargs
-    )
+def _prebuilt_name(name: str) -> str:
+    return "_" + name
+
+
+def _resolve_resource(name: str) -> str:
+    return replace_references(get_resource(name))
+
+
+def _upstream_link(name: str) -> Link:
+    asset = VENDOR_ASSETS[name]
+    return asset.url, asset.integrity
+
+
+def _load_resource(name: str, link: Callable[[str], Link], **kwargs: str) -> str:
+    # Use the version pre-resolved at build time, if available, to avoid
+    # resolving all the references on every launch.
+    try:
+        text = get_resource(_prebuilt_name(name))
+    except FileNotFoundError:
+        text = _resolve_resource(name)
+
+    return replace_placeholders(replace_links(text, link), **kwargs)
+
+
+def prebuild(path: Path) -> List[Path]:
+    """Pre-resolve the site and compile pages into the given folder.
+
+    The generated files are meant to be shipped alongside the templates in
+    the submodule ``austin_web.html``. Returns the paths of the generated
+    files.
+    """
+    prebuilt = []
+    for name in (SITE, COMPILE):
+        prebuilt_file = path / _prebuilt_name(name)
+        prebuilt_file.write_text(_resolve_resource(name), encoding="utf-8")
+        prebuilt.append(prebuilt_file)
+
+    return prebuilt
+
+
+def _data_uri(name: str, content: bytes) -> str:
+    return f"data:{get_content_type(name)};base64,{b64encode(content).decode()}"
+
+
+def _embed_css_urls(name: str, css: bytes, assets: Mapping[str, bytes]) -> bytes:
+    """Inline the vendored assets referenced by relative URLs in a stylesheet."""
+    base = posixpath.dirname(name)
+
+    def embed(match: re.Match) -> str:
+        url = match.group(1).split("?")[0].split("#")[0]
+        target = posixpath.normpath(posixpath.join(base, url))
+        try:
+            return f"url({_data_uri(target, assets[target])})"
+        except KeyError:
+            return match.group(0)
+
+    return CSS_URL_RE.sub(embed, css.decode("utf-8")).encode("utf-8")
+
+
+def load_site(static: Optional[Mapping[str, str]] = None) -> str:
+    """Load the site index page.
+
+    The optional ``static`` mapping gives the links to the assets that are
+    served locally. Any other asset is linked to its upstream URL.
+    """
+    links = static or {}
 
+    def link(name: str) -> Link:
+        try:
+            return links[name], None
+        except KeyError:
+            return _upstream_link(name)
 
-def load_site() -> str:
-    """Load the site index page."""
-    return _load_and_resolve_resource("index.html")
+    return _load_resource(SITE, link)
 
 
-def load_compile(data: str, profile_type: str) -> str:
+def load_compile(data: str, profile_type: str, offline: bool = False) -> str:
     """Load the compiler page.
 
     The ``data`` string argument is a serialised JSON object. The
-    ``profile_type`` should be either ``Time`` or ``Memory``.
+    ``profile_type`` should be either ``Time`` or ``Memory``. If ``offline``
+    is ``True``, the vendored assets are embedded into the page so that it
+    can be viewed without a network connection, and ``FileNotFoundError`` is
+    raised if any of them is missing.
     """
-    return _load_and_resolve_resource(
-        "austin_web.html",
+    assets = vendored_assets() if offline else {}
+    if offline and len(assets) < len(VENDOR_ASSETS):
+        missing = ", ".join(sorted(VENDOR_ASSETS.keys() - assets.keys()))
+        raise FileNotFoundError(f"Missing vendored UI assets: {missing}")
+
+    def link(name: str) -> Link:
+        try:
+            content = assets[name]
+        except KeyError:
+            return _upstream_link(name)
+        if name.endswith(".css"):
+            content = _embed_css_urls(name, content, assets)
+        return _data_uri(name, content), None
+
+    return _load_resource(
+        COMPILE,
+        link,
         data=data,
         profile_type=profile_type,
         label=profile_type.lower(),
@@ -0,0 +1,485 @@
+# This file is part of "austin-web" which is released under GPL.
+#
+# See file LICENCE or go to http://www.gnu.org/licenses/ for full license
+# details.
+#
+# austin-web is a Python wrapper around Austin, the CPython frame stack
+# sampler.
+#
+# Copyright (c) 2018-2020 Gabriele N. Tornetta <phoenix1987@gmail.com>.
+# All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Load testing harness for the Austin Web server.
+
+The server is run in a separate process, fed by a :class:`SampleSource` in
+place of the Austin binary, while a number of simulated websocket clients poll
+it for updates from the main process, just like the web UI does. Keeping the
+clients out of the server process ensures that the reported latency and CPU
+usage are those of the server alone.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import statistics
+import time
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import List
+from typing import Optional
+
+import aiohttp
+import psutil
+from aiohttp.test_utils import unused_port
+
+from austin_web.__main__ import AustinWeb
+
+
+if TYPE_CHECKING:
+    from multiprocessing.sharedctypes import Synchronized
+    from multiprocessing.synchronize import Event
+
+
+class SampleSource:
+    """Synthetic stand-in for the Austin sample stream.
+
+    Replays the given collapsed stack samples, cyclically, at the given rate
+    (in samples per second).
+    """
+
+    def __init__(self, samples: List[str], rate: float = 100.0) -> None:
+        if not samples:
+            raise ValueError("No samples to replay")
+        if rate <= 0:
+            raise ValueError("Sample rate must be positive")
+
+        self.samples = samples
+        self.rate = rate
+        self.emitted = 0
+
+    @classmethod
+    def from_file(cls, filename: str, rate: float = 100.0) -> "SampleSource":
+        """Create a source from a file of recorded Austin samples."""
+        with open(filename) as fin:
+            samples = [
+                line.rstrip()
+                for line in fin
+                if line.strip() and not line.startswith("#")
+            ]
+        return cls(samples, rate)
+
+    @classmethod
+    def generate(
+        cls,
+        count: int = 1000,
+        depth: int = 16,
+        breadth: int = 4,
+        rate: float = 100.0,
+        seed: int = 0,
+    ) -> "SampleSource":
+        """Create a source of random samples.
+
+        Each sample is a stack of up to ``depth`` frames, with each frame
+        picked among ``breadth`` candidates, so that the size of the resulting
+        tree can be controlled.
+        """
+        rng = random.Random(seed)
+        samples = []
+        for _ in range(count):
+            frames = ";".join(
+                f"module_{level}.py:func_{level}_{rng.randrange(breadth)}:{level + 1}"
+                for level in range(rng.randint(1, depth))
+            )
+            samples.append(f"P4242;T0:7f00;{frames} {rng.randint(100, 10000)}")
+        return cls(samples, rate)
+
+    async def replay(
+        self, callback: Callable[[str], None], stopped: Callable[[], bool]
+    ) -> int:
+        """Pass samples to the callback until stopped.
+
+        Samples are emitted in batches every few milliseconds to keep up with
+        high rates. The number of samples emitted so far is kept in the
+        ``emitted`` attribute.
+        """
+        start = time.monotonic()
+        self.emitted = 0
+        n = len(self.samples)
+        while not stopped():
+            due = int((time.monotonic() - start) * self.rate)
+            while self.emitted < due:
+                callback(self.samples[self.emitted % n])
+                self.emitted += 1
+            await asyncio.sleep(0.005)
+        return self.emitted
+
+
+class LoadTestAustinWeb(AustinWeb):
+    """AustinWeb fed by a :class:`SampleSource` instead of Austin.
+
+    The current process plays the part of both Austin and the profiled
+    process, so that the CPU and memory figures reported to the clients are
+    those of the server itself.
+    """
+
+    def __init__(
+        self,
+        source: SampleSource,
+        host: str,
+        port: int,
+        ready: Callable[[], None],
+        stopped: Callable[[], bool],
+    ) -> None:
+        super().__init__(["--host", host, "--port", str(port), "austin-web-loadtest"])
+
+        self._source = source
+        self._ready = ready
+        self._stopped = stopped
+        self.samples = 0
+
+    async def start_server(self) -> None:
+        """Start the web server and signal readiness."""
+        await super().start_server()
+        self._ready()
+
+    async def start(self, args: Optional[List[str]] = None) -> None:
+        """Replay the samples from the source until stopped."""
+        # This mirrors what AsyncAustin.start does in austin-python 1.7 once
+        # Austin is ready, down to the private attributes it sets. Keep it in
+        # sync with the austin-python version pinned in pyproject.toml (see
+        # test_austin_internals).
+        process = psutil.Process()
+        self._proc = self._child_proc = process
+        self._cmd_line = "austin-web-loadtest"
+        self._running = True
+        self._ready_callback(process, process, self._cmd_line)
+
+        try:
+            self.samples = await self._source.replay(
+                self._sample_callback, self._stopped
+            )
+        finally:
+            await self.stop_server()
+            self._running = False
+
+
+def _serve(
+    source: SampleSource,
+    host: str,
+    port: int,
+    ready: "Event",
+    stop: "Event",
+    samples: "Synchronized[int]",
+) -> None:
+    def stopped() -> bool:
+        # Publish the progress so that the samples can be counted over the
+        # same time window as the client updates.
+        samples.value = source.emitted
+        return stop.is_set()
+
+    server = LoadTestAustinWeb(source, host, port, ready.set, stopped)
+    asyncio.new_event_loop().run_until_complete(server.start())
+
+
+class ClientStats:
+    """Statistics collected by a single simulated client."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.bytes = 0
+        self.errors = 0
+
+
+class LoadTestReport:
+    """Load test results."""
+
+    def __init__(
+        self,
+        clients: List[ClientStats],
+        samples: int,
+        duration: float,
+        cpu_time: float,
+    ) -> None:
+        self.clients = clients
+        self.samples = samples
+        self.duration = duration
+        self.cpu_time = cpu_time
+
+        self.latencies = sorted(_ for c in clients for _ in c.latencies)
+
+    @property
+    def updates(self) -> int:
+        """The total number of updates received by the clients."""
+        return len(self.latencies)
+
+    @property
+    def errors(self) -> int:
+        """The total number of client errors."""
+        return sum(c.errors for c in self.clients)
+
+    @property
+    def bytes_per_client(self) -> float:
+        """The average number of bytes received by each client."""
+        return sum(c.bytes for c in self.clients) / len(self.clients)
+
+    @property
+    def cpu_percent(self) -> float:
+        """The server CPU usage over the test duration."""
+        return 100 * self.cpu_time / self.duration if self.duration else 0.0
+
+    def percentile(self, p: int) -> float:
+        """The given percentile of the update latency, in seconds."""
+        if not self.latencies:
+            return float("nan")
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[p - 1]
+
+    def __str__(self) -> str:
+        """The human-readable report."""
+        return "\n".join(
+            (
+                f"Clients           {len(self.clients)}",
+                f"Duration          {self.duration:.2f} s",
+                f"Samples           {self.samples} ({self.samples / self.duration:.0f}/s)",
+                f"Updates           {self.updates} ({self.updates / self.duration:.1f}/s)",
+                f"Errors            {self.errors}",
+                f"Latency p50       {self.percentile(50) * 1e3:.2f} ms",
+                f"Latency p99       {self.percentile(99) * 1e3:.2f} ms",
+                f"Bytes per client  {self.bytes_per_client:.0f}",
+                f"Server CPU        {self.cpu_percent:.1f}%",
+            )
+        )
+
+
+async def _client(
+    url: str, interval: float, duration: float, timeout: float, stats: ClientStats
+) -> None:
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(url) as ws:
+                info = await ws.receive_str(timeout=timeout)
+                stats.bytes += len(info.encode())
+
+                while loop.time() < end:
+                    start = time.perf_counter()
+                    await ws.send_str("data")
+                    msg = await ws.receive(timeout=timeout)
+                    if msg.type is not aiohttp.WSMsgType.TEXT:
+                        stats.errors += 1
+                        break
+                    stats.latencies.append(time.perf_counter() - start)
+                    stats.bytes += len(msg.data.encode())
+
+                    await asyncio.sleep(
+                        max(
+                            0.0,
+                            min(
+                                interval - (time.perf_counter() - start),
+                                end - loop.time(),
+                            ),
+                        )
+                    )
+    except (aiohttp.ClientError, asyncio.TimeoutError, TypeError):
+        # TypeError is raised for a non-text info message
+        stats.errors += 1
+
+
+async def _run_clients(
+    url: str, clients: int, interval: float, duration: float, timeout: float
+) -> List[ClientStats]:
+    stats = [ClientStats() for _ in range(clients)]
+    await asyncio.gather(*(_client(url, interval, duration, timeout, s) for s in stats))
+    return stats
+
+
+def run_load_test(
+    source: SampleSource,
+    clients: int = 10,
+    duration: float = 10.0,
+    interval: float = 3.0,
+    timeout: float = 10.0,
+    host: str = "localhost",
+    port: int = 0,
+) -> LoadTestReport:
+    """Run a load test against a local Austin Web server.
+
+    Each of the ``clients`` simulated clients requests an update every
+    ``interval`` seconds, like the web UI does, for ``duration`` seconds.
+    Updates that take longer than ``timeout`` seconds are counted as errors.
+    """
+    if clients <= 0:
+        raise ValueError("The number of clients must be positive")
+    if duration <= 0 or interval <= 0 or timeout <= 0:
+        raise ValueError("Duration, interval and timeout must be positive")
+
+    port = port or unused_port()
+    ready, stop = multiprocessing.Event(), multiprocessing.Event()
+    samples = multiprocessing.Value("q", 0)
+    server = multiprocessing.Process(
+        target=_serve, args=(source, host, port, ready, stop, samples), daemon=True
+    )
+    server.start()
+
+    try:
+        while not ready.wait(0.1):
+            if not server.is_alive():
+                raise RuntimeError("Austin Web server did not start")
+
+        process = psutil.Process(server.pid)
+        cpu_start, wall_start = process.cpu_times(), time.monotonic()
+        samples_start = samples.value
+
+        stats = asyncio.run(
+            _run_clients(
+                f"http://{host}:{port}/ws", clients, interval, duration, timeout
+            )
+        )
+
+        cpu_end, wall_end = process.cpu_times(), time.monotonic()
+        samples_end = samples.value
+    finally:
+        stop.set()
+        server.join(timeout)
+        if server.is_alive():
+            server.terminate()
+
+    return LoadTestReport(
+        stats,
+        samples_end - samples_start,
+        wall_end - wall_start,
+        (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system),
+    )
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """The load test main function."""
+    parser = ArgumentParser(
+        prog="austin-web-loadtest",
+        description="Load test the Austin Web server with simulated clients.",
+    )
+    parser.add_argument(
+        "-c",
+        "--clients",
+        help="Number of clients. Defaults to 10.",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        help="Test duration in seconds. Defaults to 10.",
+        type=float,
+        default=10.0,
+    )
+    parser.add_argument(
+        "-i",
+        "--interval",
+        help="Client update interval in seconds. Defaults to 3, like the web UI.",
+        type=float,
+        default=3.0,
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        help="Client update timeout in seconds. Defaults to 10.",
+        type=float,
+        default=10.0,
+    )
+    parser.add_argument(
+        "-r",
+        "--rate",
+        help="Sample rate in samples per second. Defaults to 100.",
+        type=float,
+        default=100.0,
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        help="Replay the samples recorded in the given file instead of "
+        "generating random ones.",
+        type=str,
+    )
+    parser.add_argument(
+        "--depth",
+        help="Maximum depth of generated stacks. Defaults to 16.",
+        type=int,
+        default=16,
+    )
+    parser.add_argument(
+        "--breadth",
+        help="Number of distinct frames per level in generated stacks. "
+        "Defaults to 4.",
+        type=int,
+        default=4,
+    )
+    parser.add_argument(
+        "-H",
+        "--host",
+        help="Set the host to serve on. Defaults to localhost.",
+        type=str,
+        default="localhost",
+    )
+    parser.add_argument(
+        "-P",
+        "--port",
+        help="Set the port to serve on. Defaults to an ephemeral port.",
+        type=int,
+        default=0,
+    )
+    opts = parser.parse_args(args)
+
+    for option in (
+        "clients",
+        "duration",
+        "interval",
+        "timeout",
+        "rate",
+        "depth",
+        "breadth",
+    ):
+        if getattr(opts, option) <= 0:
+            parser.error(f"--{option} must be positive")
+
+    try:
+        source = (
+            SampleSource.from_file(opts.file, opts.rate)
+            if opts.file
+            else SampleSource.generate(
+                depth=opts.depth, breadth=opts.breadth, rate=opts.rate
+            )
+        )
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot load samples: {e}")
+
+    report = run_load_test(
+        source,
+        clients=opts.clients,
+        duration=opts.duration,
+        interval=opts.interval,
+        timeout=opts.timeout,
+        host=opts.host,
+        port=opts.port,
+    )
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Static asset serving utilities.
+
+Assets are compressed once, when they are loaded, and served with an ETag so
+that clients can revalidate their cached copies cheaply.
+"""
+
+import gzip
+import hashlib
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from aiohttp import web
+
+from austin_web.html import get_content_type
+from austin_web.html import vendored_assets
+
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Cache policies for URLs that carry the asset version, which never change,
+# and for any other URL, which must be revalidated on every use.
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+IDENTITY = "identity"
+
+# Supported content encodings, in order of preference.
+COMPRESSORS: List[Tuple[str, Callable[[bytes], bytes]]] = [
+    ("gzip", lambda body: gzip.compress(body, compresslevel=9, mtime=0))
+]
+if brotli is not None:
+    COMPRESSORS.insert(0, ("br", lambda body: brotli.compress(body)))
+
+
+def _accepted_encodings(header: str) -> Set[str]:
+    accepted = set()
+    for token in header.split(","):
+        encoding, _, params = token.partition(";")
+        _, _, q = params.partition("q=")
+        try:
+            if q and not float(q):
+                continue
+        except ValueError:
+            continue
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+class StaticAsset:
+    """Static asset, precompressed in all the supported encodings."""
+
+    def __init__(self, name: str, body: bytes, content_type: str) -> None:
+        self.name = name
+        self.content_type = content_type
+        self.charset = (
+            "utf-8"
+            if content_type.startswith("text/") or content_type.endswith("javascript")
+            else None
+        )
+        self.version = hashlib.sha256(body).hexdigest()[:16]
+
+        self.encodings: Dict[str, bytes] = {}
+        for encoding, compress in COMPRESSORS:
+            compressed = compress(body)
+            if len(compressed) < len(body):
+                self.encodings[encoding] = compressed
+        self.encodings[IDENTITY] = body
+
+    @property
+    def url(self) -> str:
+        """The versioned URL of the asset, relative to the site root."""
+        return f"static/{self.name}?v={self.version}"
+
+    def etag(self, encoding: str) -> str:
+        """The ETag of the asset in the given encoding."""
+        if encoding == IDENTITY:
+            return f'"{self.version}"'
+        return f'"{self.version}-{encoding}"'
+
+    def response(self, request: web.Request, cache_control: str) -> web.Response:
+        """Make the response to the request for the asset.
+
+        The best encoding accepted by the client is chosen, and an empty
+        response is returned if the client already has an up-to-date copy.
+        """
+        accepted = _accepted_encodings(request.headers.get("Accept-Encoding", ""))
+        encoding = next(
+            (_ for _ in self.encodings if _ in accepted or _ == IDENTITY), IDENTITY
+        )
+
+        etag = self.etag(encoding)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if len(self.encodings) > 1:
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = {
+            _.strip().removeprefix("W/")
+            for _ in request.headers.get("If-None-Match", "").split(",")
+        }
+        if etag in if_none_match or "*" in if_none_match:
+            return web.Response(status=304, headers=headers)
+
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+
+        return web.Response(
+            body=self.encodings[encoding],
+            content_type=self.content_type,
+            charset=self.charset,
+            headers=headers,
+        )
+
+
+def load_static_assets() -> Dict[str, StaticAsset]:
+    """Load and precompress the vendored assets."""
+    return {
+        name: StaticAsset(name, body, get_content_type(name))
+        for name, body in vendored_assets().items()
+    }
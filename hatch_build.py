@@ -0,0 +1,107 @@
+import shutil
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+ROOT = Path(__file__).parent.resolve()
+VENDOR_DIR = ROOT / "austin_web" / "html" / "vendor"
+
+
+def _html() -> Any:
+    sys.path.insert(0, str(ROOT))
+    try:
+        from austin_web import html
+    finally:
+        sys.path.remove(str(ROOT))
+    return html
+
+
+def check_vendored() -> List[str]:
+    """Check the vendored assets against the pinned integrity hashes.
+
+    Returns the list of problems found.
+    """
+    html = _html()
+
+    problems = []
+    for name, asset in html.VENDOR_ASSETS.items():
+        path = VENDOR_DIR / name
+        if not path.exists():
+            problems.append(f"{name} is not vendored")
+        elif asset.integrity is None:
+            problems.append(f"{name} has no pinned integrity hash")
+        elif html.integrity(path.read_bytes()) != asset.integrity:
+            problems.append(f"{name} does not match its pinned integrity hash")
+
+    return problems
+
+
+def refresh() -> None:
+    """Download the pinned third-party assets into the vendor folder.
+
+    Assets with a pinned integrity hash are verified, and the hashes of those
+    without one are printed so that they can be pinned.
+    """
+    html = _html()
+
+    for name, asset in html.VENDOR_ASSETS.items():
+        with urllib.request.urlopen(asset.url, timeout=30) as response:
+            content = response.read()
+
+        integrity = html.integrity(content)
+        if asset.integrity is not None and integrity != asset.integrity:
+            raise RuntimeError(f"Integrity check failed for {asset.url}")
+
+        path = VENDOR_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+        print(f"Vendored {name}")
+        if asset.integrity is None:
+            print(f"  Pin integrity: {integrity}")
+
+
+class PrebuildHook(BuildHookInterface):
+    """Pre-resolve the HTML pages so that they need not be at runtime."""
+
+    def initialize(self, version: str, build_data: Dict[str, Any]) -> None:
+        """Generate the pre-resolved pages for standard wheels."""
+        self._build_dir: Optional[Path] = None
+
+        # Editable installs resolve the pages at runtime to pick up changes.
+        if version == "editable":
+            return
+
+        # Wheels must work offline, so all the vendored assets must be there.
+        problems = check_vendored()
+        if problems:
+            raise RuntimeError(
+                "Invalid vendored UI assets (run 'python hatch_build.py' to "
+                "refresh them):\n" + "\n".join(f"  - {_}" for _ in problems)
+            )
+
+        # The pre-resolved pages are generated outside of the source tree, so
+        # that they cannot shadow the templates in a checkout.
+        self._build_dir = Path(tempfile.mkdtemp(prefix="austin-web-build-"))
+
+        for path in _html().prebuild(self._build_dir):
+            build_data["force_include"][str(path)] = f"austin_web/html/{path.name}"
+
+    def finalize(
+        self, version: str, build_data: Dict[str, Any], artifact_path: str
+    ) -> None:
+        """Remove the generated files."""
+        if self._build_dir is not None:
+            shutil.rmtree(self._build_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    refresh()
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from zipfile import ZipFile
+
+from hatchling.builders.wheel import WheelBuilder
+
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_wheel_prebuilt_pages(tmp_path):
+    (wheel,) = WheelBuilder(str(ROOT)).build(
+        directory=str(tmp_path), versions=["standard"]
+    )
+
+    with ZipFile(wheel) as zf:
+        names = set(zf.namelist())
+        assert "austin_web/html/_index.html" in names
+        assert "austin_web/html/_austin_web.html" in names
+        zf.extractall(tmp_path / "wheel")
+
+    # The installed package must not need the templates to load the site.
+    (tmp_path / "wheel" / "austin_web" / "html" / "ui.html").unlink()
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from austin_web.html import load_site; print(load_site())",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(tmp_path / "wheel")},
+    )
+    assert "{{" not in result.stdout
+    assert "[[" not in result.stdout
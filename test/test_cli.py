@@ -1,10 +1,26 @@
 from austin.cli import AustinCommandLineError
 from pytest import raises
 
+from austin_web import __main__ as main
 from austin_web.__main__ import AustinWeb
+from austin_web.__main__ import AustinWebError
 from austin_web.__main__ import _main
 
 
 def test_compile_serve():
     with raises(AustinCommandLineError):
         _main(AustinWeb, ["--compile", "foo", "--serve"])
+
+
+def test_offline_serve():
+    with raises(AustinCommandLineError):
+        _main(AustinWeb, ["--offline", "python"])
+
+
+def test_offline_missing_assets(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "missing_assets", lambda: ["d3/d3.v4.min.js"])
+
+    with raises(AustinWebError, match="d3/d3.v4.min.js"):
+        _main(
+            AustinWeb, ["--compile", str(tmp_path / "out.html"), "--offline", "python"]
+        )
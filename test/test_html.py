@@ -1,9 +1,13 @@
 import re
+from base64 import b64decode
 
+from pytest import raises
 from requests import get
 
+from austin_web import html
 from austin_web.html import load_compile
 from austin_web.html import load_site
+from austin_web.html import prebuild
 
 
 URL_RE = re.compile(r"(?:src|href)=\"(http[s]*://[^\"]+)\"")
@@ -30,3 +34,92 @@ def test_load_compile():
 
     for url in URL_RE.findall(compile):
         fetch_cdn(url)
+
+
+def test_prebuild(tmp_path):
+    site, compile = prebuild(tmp_path)
+
+    for prebuilt in (site, compile):
+        assert "{{" not in prebuilt.read_text()
+        assert "[[ src: d3/d3.v4.min.js ]]" in prebuilt.read_text()
+    assert "((% data %))" in compile.read_text()
+
+
+def test_load_site_prebuilt(monkeypatch):
+    get_resource = html.get_resource
+
+    def prebuilt_only(name):
+        if name == "index.html":
+            raise AssertionError("template loaded")
+        if name == "_index.html":
+            return "<prebuilt/>"
+        return get_resource(name)
+
+    monkeypatch.setattr(html, "get_resource", prebuilt_only)
+
+    assert load_site() == "<prebuilt/>"
+
+
+def test_load_site_static():
+    site = load_site({"d3/d3.v4.min.js": "static/d3/d3.v4.min.js?v=1234"})
+
+    assert '<script src="static/d3/d3.v4.min.js?v=1234"' in site
+    assert "[[" not in site
+
+
+def test_load_compile_offline(monkeypatch):
+    assets = {name: b"" for name in html.VENDOR_ASSETS}
+    assets["d3/d3.v4.min.js"] = b"// d3"
+    assets["fontawesome/css/all.min.css"] = b"src:url(../webfonts/fa-solid-900.woff2)"
+    assets["fontawesome/webfonts/fa-solid-900.woff2"] = b"font"
+    monkeypatch.setattr(html, "vendored_assets", lambda: assets)
+
+    compile = load_compile("{test}", "Time", offline=True)
+
+    assert "data:text/javascript;base64,Ly8gZDM=" in compile
+    assert "data:text/css;base64," in compile
+    for asset in html.VENDOR_ASSETS.values():
+        assert asset.url not in compile
+
+    *_, css = re.findall(r"data:text/css;base64,([^\"]*)", compile)
+    assert b"url(data:font/woff2;base64,Zm9udA==)" in b64decode(css)
+
+
+def test_load_compile_offline_missing(monkeypatch):
+    monkeypatch.setattr(html, "vendored_assets", lambda: {"d3/d3.v4.min.js": b""})
+
+    with raises(FileNotFoundError, match="d3-tip/d3-tip.min.js"):
+        load_compile("{test}", "Time", offline=True)
+
+
+def test_load_site_integrity(monkeypatch):
+    monkeypatch.setitem(
+        html.VENDOR_ASSETS,
+        "d3/d3.v4.min.js",
+        html.VendorAsset("https://d3js.org/d3.v4.min.js", "sha384-1234"),
+    )
+
+    site = load_site()
+    assert (
+        '<script src="https://d3js.org/d3.v4.min.js" integrity="sha384-1234" '
+        'crossorigin="anonymous"' in site
+    )
+
+    site = load_site({"d3/d3.v4.min.js": "static/d3/d3.v4.min.js?v=1234"})
+    assert "sha384-1234" not in site
+
+
+def test_vendored_assets():
+    assert not html.missing_assets()
+
+    assets = html.vendored_assets()
+    for name, asset in html.VENDOR_ASSETS.items():
+        assert asset.integrity is not None, name
+        assert html.integrity(assets[name]) == asset.integrity, name
+
+
+def test_content_type():
+    assert html.get_content_type("d3/d3.v4.min.js") == "text/javascript"
+    assert html.get_content_type("fa-solid-900.woff2") == "font/woff2"
+    assert html.get_content_type("logo.png") == "image/png"
+    assert html.get_content_type("LICENSE") == "application/octet-stream"
@@ -0,0 +1,96 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import unused_port
+from pytest import raises
+
+from austin_web.__main__ import AustinWeb
+from austin_web.data import WebFrame
+from austin_web.loadtest import ClientStats
+from austin_web.loadtest import SampleSource
+from austin_web.loadtest import _client
+from austin_web.loadtest import main
+from austin_web.loadtest import run_load_test
+
+
+def test_generated_samples():
+    source = SampleSource.generate(count=100, depth=8, breadth=2)
+
+    for sample in source.samples:
+        assert WebFrame.parse(sample).height <= 8 + 3
+
+
+def test_load_test():
+    report = run_load_test(
+        SampleSource.generate(rate=500), clients=4, duration=1, interval=0.1
+    )
+
+    assert report.errors == 0
+    assert report.samples > 0
+    assert report.updates >= 4
+    assert report.bytes_per_client > 0
+    assert 0 < report.percentile(50) <= report.percentile(99)
+    assert report.cpu_percent > 0
+
+
+def test_load_test_invalid_options():
+    with raises(ValueError):
+        run_load_test(SampleSource.generate(), clients=0)
+
+    for option in ("--clients", "--duration", "--interval", "--timeout"):
+        with raises(SystemExit):
+            main([option, "0"])
+
+
+def test_client_stalled_server():
+    async def stall(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await asyncio.sleep(1)
+        return ws
+
+    async def run():
+        app = web.Application()
+        app.add_routes([web.get("/ws", stall)])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        port = unused_port()
+        await web.TCPSite(runner, "localhost", port).start()
+
+        stats = ClientStats()
+        try:
+            await _client(f"http://localhost:{port}/ws", 0.1, 1, 0.2, stats)
+        finally:
+            await runner.cleanup()
+        return stats
+
+    stats = asyncio.run(run())
+
+    assert stats.errors == 1
+    assert not stats.latencies
+
+
+def test_load_test_invalid_samples(tmp_path):
+    for option in ("--depth", "--breadth"):
+        with raises(SystemExit):
+            main([option, "0"])
+
+    empty = tmp_path / "empty.austin"
+    empty.write_text("# austin: 3.6.0\n\n")
+    with raises(SystemExit):
+        main(["--file", str(empty)])
+
+
+def test_austin_internals():
+    # LoadTestAustinWeb mirrors these austin-python internals
+    austin = AustinWeb(["python"])
+
+    for attribute in (
+        "_proc",
+        "_child_proc",
+        "_cmd_line",
+        "_running",
+        "_ready_callback",
+        "_sample_callback",
+    ):
+        assert hasattr(austin, attribute), attribute
@@ -23,6 +23,12 @@ class AustinWebTest(AustinWeb):
             content = await response.read()
             assert b'<div id="chart"' in content
 
+            etag = response.headers["ETag"]
+            response = await session.get(
+                "http://localhost:5000", headers={"If-None-Match": etag}
+            )
+            assert response.status == 304
+
 
 def test_serve():
     _main(AustinWebTest, ["--port", "5000", "python", "test/target.py"])
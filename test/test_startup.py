@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+
+# Modules that should only be imported in the mode that needs them.
+SERVE_MODULES = {"aiohttp", "aiohttp.web"}
+COMPILE_MODULES = {"halo"}
+
+
+def imported_modules(code):
+    """Run the given code and return the modules imported by it.
+
+    The modules are collected from the ``-X importtime`` report, along with
+    their cumulative import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        modules[module.strip()] = int(cumulative)
+
+    return modules
+
+
+def import_time(module, runs=5):
+    """The best cumulative import time of the given module over a few runs."""
+    return min(imported_modules(f"import {module}")[module] for _ in range(runs))
+
+
+def test_import_main():
+    modules = imported_modules("import austin_web.__main__")
+
+    assert not modules.keys() & (SERVE_MODULES | COMPILE_MODULES)
+
+
+def test_import_time():
+    # Importing the web server alone used to be most of the startup time, so
+    # the whole of the CLI must now take less than that.
+    assert import_time("austin_web.__main__") < import_time("aiohttp.web")
+
+
+def test_compile_mode_imports(tmp_path):
+    output = tmp_path / "austin.html"
+    modules = imported_modules(
+        "from austin_web.__main__ import AustinWeb\n"
+        f"austin = AustinWeb(['--compile', {str(output)!r}, 'python'])\n"
+        "austin.on_ready()\n"
+        "austin.on_sample_received('P42;T0:7f00;foo.py:foo:1 1000')\n"
+        "austin._spinner.stop()\n"
+        "austin.compile()\n"
+    )
+
+    assert "foo.py" in output.read_text()
+    assert "halo" in modules
+    assert not modules.keys() & SERVE_MODULES
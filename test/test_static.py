@@ -0,0 +1,57 @@
+from aiohttp.test_utils import make_mocked_request
+
+from austin_web.static import IMMUTABLE
+from austin_web.static import REVALIDATE
+from austin_web.static import StaticAsset
+
+
+BODY = b"function foo() { return 42; }\n" * 100
+
+
+def request(**headers):
+    return make_mocked_request("GET", "/static/foo.js", headers=headers)
+
+
+def test_static_asset_gzip():
+    asset = StaticAsset("foo.js", BODY, "text/javascript")
+
+    response = asset.response(request(**{"Accept-Encoding": "gzip"}), IMMUTABLE)
+
+    assert response.status == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Cache-Control"] == IMMUTABLE
+    assert response.headers["ETag"] == asset.etag("gzip")
+    assert len(response.body) < len(BODY)
+
+
+def test_static_asset_identity():
+    asset = StaticAsset("foo.js", BODY, "text/javascript")
+
+    for accept in ("", "gzip;q=0", "deflate"):
+        response = asset.response(request(**{"Accept-Encoding": accept}), REVALIDATE)
+
+        assert "Content-Encoding" not in response.headers
+        assert response.body == BODY
+
+
+def test_static_asset_not_modified():
+    asset = StaticAsset("foo.js", BODY, "text/javascript")
+
+    response = asset.response(
+        request(**{"Accept-Encoding": "gzip", "If-None-Match": asset.etag("gzip")}),
+        REVALIDATE,
+    )
+    assert response.status == 304
+
+    response = asset.response(
+        request(**{"If-None-Match": asset.etag("gzip")}), REVALIDATE
+    )
+    assert response.status == 200
+
+
+def test_static_asset_url():
+    asset = StaticAsset("foo.js", BODY, "text/javascript")
+
+    assert asset.url == f"static/foo.js?v={asset.version}"
+    other = StaticAsset("foo.js", BODY + b"\n", "text/javascript")
+    assert asset.version != other.version